@@ -59,9 +59,107 @@ def test_station_functions():
     src1 = FixedTarget(coord=coord.SkyCoord('0h0m0s 30d0m0s'), name='testSrc')
     # a_station.elevation(times1, src1)  # Should have elevation ranging -5 to 16.8 deg.
     # a_station.elevation(times1, src1)  # Should have elevation ranging 3.7 to 34 deg.
-    assert len(a_station.is_visible(times1, src1)[0]) == 0
-    assert len(a_station.is_visible(times2, src1)[0]) == 10
+    assert a_station.is_visible(times1, src1).dtype == bool
+    assert a_station.is_visible(times1, src1).sum() == 0
+    assert a_station.is_visible(times2, src1).sum() == 10
     assert len(a_station.elevation(times2, src1)) == len(times1)
     assert np.equal(a_station.elevation(times2, src1).value, a_station.altaz(times2, src1).alt.value)[0]
 
 
+def test_stations_band_selection():
+    """Tests the SEFD table at the network level and the band-based sub-network selection.
+    """
+    station1 = stations.Station('name1', 'N1', 'VLBI', coord.EarthLocation(0., 0., 0.),
+                                {'18cm': 100, '6cm': 40}, 10)
+    station2 = stations.Station('name2', 'N2', 'VLBI', coord.EarthLocation(0., 0., 0.),
+                                {'6cm': 20}, 10)
+    a_network = stations.Stations('a_network', [station1, station2])
+    assert a_network.sefd_table.shape[0] == 2
+    assert a_network.sefd_table[0, stations.band_index('18cm')] == 100
+    assert np.isinf(a_network.sefd_table[1, stations.band_index('18cm')])
+    assert a_network.stations_with_band('6cm').codenames == ('N1', 'N2')
+    assert a_network.stations_with_band('18cm').codenames == ('N1',)
+    assert len(a_network.stations_with_band('92cm')) == 0
+
+
+def test_stations_indexing():
+    """Tests the indexing (by position and by codename) and deletion of stations in a network.
+    """
+    station1 = stations.Station('name1', 'N1', 'VLBI', coord.EarthLocation(0., 0., 0.), {}, 10)
+    station2 = stations.Station('name2', 'N2', 'VLBI', coord.EarthLocation(0., 0., 0.), {}, 10)
+    a_network = stations.Stations('a_network', [station1, station2])
+    assert a_network[0] is station1
+    assert a_network['N2'] is station2
+    del a_network[0]
+    assert a_network.codenames == ('N2',)
+    del a_network['N2']
+    assert len(a_network) == 0
+    sub = stations.Stations.get_stations_from_configfile(codenames=['Ef', 'Wb'])\
+                           .select_stations(['Ef'])
+    assert sub.codenames == ('Ef',)
+
+
+def test_stations_visibility():
+    """Tests the batched visibility computed at the network level, which must match
+    the per-station computations.
+    """
+    sefds = {'18': 100, '6': 40, '0.1': 200}
+    station1 = stations.Station('name1', 'N1', 'VLBI',
+                                coord.EarthLocation(3839348.973*u.m, 430403.51*u.m, 5057990.099*u.m),
+                                sefds, 20)
+    station2 = stations.Station('name2', 'N2', 'VLBI',
+                                coord.EarthLocation(-1601185.4*u.m, -5041977.5*u.m, 3554875.9*u.m),
+                                sefds, 10)
+    a_network = stations.Stations('a_network', [station1, station2])
+    times = Time('2020-03-21 3:00') + np.arange(0, 4*60, 10)*u.min
+    src = FixedTarget(coord=coord.SkyCoord('0h0m0s 30d0m0s'), name='testSrc')
+    visible = a_network.visibility(times, src)
+    assert visible.shape == (2, len(times), 1)
+    assert visible.dtype == bool
+    for i, a_station in enumerate(a_network):
+        elevs = a_station.elevation(times, src)
+        assert np.array_equal(visible[i, :, 0], elevs >= a_station.min_elevation)
+
+    grid = a_network.elevation_grid(times, src)
+    assert (grid.shape == visible.shape) and (grid.dtype == np.float32)
+    assert np.allclose(grid[0, :, 0], a_network[0].elevation(times, src).deg, atol=1e-3)
+    grid64 = a_network.elevation_grid(times, src, dtype=np.float64)
+    assert grid64.dtype == np.float64
+
+
+def test_altaz_all_restores_astrom_state():
+    """Tests that the threaded altaz computation does not leak the interpolated astrom
+    context into the process-wide erfa_astrom state.
+    """
+    from astropy.coordinates.erfa_astrom import erfa_astrom, ErfaAstromInterpolator
+    station1 = stations.Station('name1', 'N1', 'VLBI',
+                                coord.EarthLocation(3839348.973*u.m, 430403.51*u.m, 5057990.099*u.m),
+                                {}, 20)
+    station2 = stations.Station('name2', 'N2', 'VLBI',
+                                coord.EarthLocation(-1601185.4*u.m, -5041977.5*u.m, 3554875.9*u.m),
+                                {}, 10)
+    a_network = stations.Stations('a_network', [station1, station2])
+    times = Time('2020-03-21 0:00') + np.arange(0, 5100)*u.min  # large enough to go threaded
+    src = coord.SkyCoord('0h0m0s 30d0m0s')
+    altaz = a_network.altaz_all(times, src)
+    assert set(altaz.keys()) == {'N1', 'N2'}
+    assert not isinstance(erfa_astrom.get(), ErfaAstromInterpolator)
+
+
+def test_stations_rise_set():
+    """Tests the grid search of the rise and set times at the network level.
+    The source elevation at the returned times must match the station minimum elevation.
+    """
+    a_station = stations.Station('name', 'Nm', 'VLBI',
+                                 coord.EarthLocation(3839348.973*u.m, 430403.51*u.m, 5057990.099*u.m),
+                                 {'18': 100}, 20)
+    a_network = stations.Stations('a_network', [a_station])
+    times = Time('2020-03-21 0:00') + np.array([0, 24])*u.h
+    src = FixedTarget(coord=coord.SkyCoord('0h0m0s 30d0m0s'), name='testSrc')
+    rises, sets = a_network.rise_set_grid(times, src, N=200)['Nm']
+    assert (len(rises) == 1) and (len(sets) == 1)
+    for a_time in (rises[0], sets[0]):
+        elev = a_station.elevation(a_time.reshape(1), src)[0]
+        assert abs(elev.deg - a_station.min_elevation.to_value(u.deg)) < 0.5
+
+
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+# Licensed under GPLv3+ - see LICENSE
+import numpy as np
+import erfa
+from astropy import coordinates as coord
+from astropy.coordinates.erfa_astrom import erfa_astrom
+from astropy.time import Time
+
+"""Direct ICRS-to-altitude transformation calling the erfa routines straight away.
+
+Going through the astropy/astroplan machinery builds SkyCoord objects and traverses the
+frame transform graph for every call, while the visibility computations only ever need the
+altitude of an ICRS target as seen from a ground station. This module assembles the erfa
+astrometric context once per call (honouring whatever `erfa_astrom` context is active, so
+the interpolation set up in `vlbiplanobs.stations` applies here too) and chains
+`erfa.atciqz` + `erfa.atioq`, skipping all the Python-level frame handling.
+
+Note that no atmospheric refraction is applied, consistent with the AltAz frames used in
+`vlbiplanobs.stations` (which never set pressure).
+"""
+
+__all__ = ['icrs_to_alt']
+
+
+def icrs_to_alt(ra_rad: float, dec_rad: float, obs_times: Time,
+                location: coord.EarthLocation) -> np.ndarray:
+    """Returns the altitude of an ICRS target as seen from the given location at the
+    given times, computed directly with the erfa routines.
+
+    Inputs
+    - ra_rad : float
+        Right ascension (ICRS) of the target, in radians.
+    - dec_rad : float
+        Declination (ICRS) of the target, in radians.
+    - obs_times : astropy.time.Time
+        Time(s) to compute the altitude of the target
+        (either a single timestamp or an array of times).
+    - location : astropy.coordinates.EarthLocation
+        Position of the observer.
+
+    Output
+    - alt_rad : numpy.ndarray
+        Altitude of the target at each given time, in radians (no refraction applied).
+    """
+    frame = coord.AltAz(obstime=obs_times, location=location)
+    astrom = erfa_astrom.get().apco(frame)
+    ri, di = erfa.atciqz(ra_rad, dec_rad, astrom)
+    _aob, zob, _hob, _dob, _rob = erfa.atioq(ri, di, astrom)
+    return np.pi/2 - zob
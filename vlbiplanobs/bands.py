@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+# Licensed under GPLv3+ - see LICENSE
+from vlbiplanobs import freqsetups
+
+"""Canonical ordering of the observing bands used across the package.
+
+While the band names are in principle free-format strings (the keys used in the
+`freqs_sefds` attribute of each station), bulk operations over a network of stations
+are much faster when each band maps to a fixed column in a NumPy array. This module
+keeps that canonical ordering: the bands known from `freqsetups` come first, and any
+other band encountered at runtime is appended at the end.
+"""
+
+__all__ = ['BANDS', 'BAND_INDEX', 'band_index']
+
+BANDS = list(freqsetups.bands.keys())
+BAND_INDEX = {a_band: i for i, a_band in enumerate(BANDS)}
+
+
+def band_index(band: str) -> int:
+    """Returns the canonical (column) index assigned to the given band.
+
+    Inputs
+    - band : str
+        A string representing an observing band (e.g. '18cm').
+
+    Output
+    - index : int
+        The index of the given band in `BANDS`. If the band was not known yet,
+        it is registered (appended at the end of `BANDS`) and its new index returned.
+    """
+    if band not in BAND_INDEX:
+        BAND_INDEX[band] = len(BANDS)
+        BANDS.append(band)
+
+    return BAND_INDEX[band]
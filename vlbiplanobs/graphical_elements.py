@@ -155,7 +155,7 @@ def summary_card_worldmap(app, obs: observation.Observation) -> html.Div:
     ants_up = obs.is_visible()
     ant_no_obs = []
     for an_ant in ants_up:
-        if len(ants_up[an_ant][0]) == 0:
+        if not ants_up[an_ant].any():
             ant_no_obs.append(an_ant)
 
     return worldmap_plot([obs.stations[a] for a in obs.stations.codenames \
@@ -170,7 +170,7 @@ def summary_card_antennas(app, obs: observation.Observation) -> list:
     ants_up = obs.is_visible()
     ant_no_obs = []
     for an_ant in ants_up:
-        if len(ants_up[an_ant][0]) == 0:
+        if not ants_up[an_ant].any():
             ant_no_obs.append(an_ant)
 
     ant_text = ', '.join([ant for ant in obs.stations.codenames if ant not in ant_no_obs]) + '.'
@@ -371,7 +371,7 @@ def summary_printable(app, obs):
     ants_up = obs.is_visible()
     ant_no_obs = []
     for an_ant in ants_up:
-        if len(ants_up[an_ant][0]) == 0:
+        if not ants_up[an_ant].any():
             ant_no_obs.append(an_ant)
 
     ants = [ant for ant in obs.stations.codenames if ant not in ant_no_obs]
@@ -493,8 +493,8 @@ class Observation(object):
         Returns
             is_visible : dict
                 Dictionary where they keys are the station code names, and the values will be
-                a tuple containing a numpy array with the indexes in the `Observation.times`
-                array with the times where the target source can be observed by the station.
+                a boolean numpy array, with the same shape as `Observation.times`, that is True
+                at the times when the target source can be observed by the station.
 
                 In this sense, you can e.g. call obs.times[obs.is_visible[a_station_codename]]
                 to get such times.
@@ -803,8 +803,8 @@ class Observation(object):
             ants_up = self.is_visible()
             for i,bl_name in enumerate(bl_names):
                 ant1, ant2 = bl_name.split('-')
-                bl_up = (np.array([a for a in ants_up[ant1][0] if a in ants_up[ant2][0]]), )
-                if len(bl_up[0]) > 0:
+                bl_up = ants_up[ant1] & ants_up[ant2]
+                if bl_up.any():
                     bl_uv_up[bl_name] = (bl_uv[:,:,i][bl_up]/self.wavelength).decompose()
 
             if len(bl_uv_up.keys()) == 0:
@@ -1055,7 +1055,7 @@ class Observation(object):
             # xs = [obs.times.datetime[0].date() + datetime.timedelta(seconds=i*3600) for i in np.unwrap(obs.gstimes.value*2*np.pi/24)[data_dict[ant]]*24/(2*np.pi)]
             xs = gstimes[data_dict[ant]]
             data_fig.append({'x': xs,
-                             'y': np.zeros_like(data_dict[ant][0])-i, 'type': 'scatter',
+                             'y': np.zeros(len(xs))-i, 'type': 'scatter',
                              'hovertemplate': "GST %{x}",
                              'mode': 'markers', 'marker_symbol': "41",
                              'hoverinfo': "skip",
@@ -2,21 +2,165 @@
 # Licensed under GPLv3+ - see LICENSE
 from __future__ import annotations
 from collections import abc
+from concurrent import futures
 import configparser
+import contextlib
+import functools
+import itertools
+import warnings
 from importlib import resources
 import numpy as np
 from astropy import units as u
 from astropy import coordinates as coord
 from astropy.io import ascii
 from astropy.time import Time
+from astropy.coordinates.erfa_astrom import erfa_astrom, ErfaAstromInterpolator
 from astroplan import Observer, FixedTarget
+from vlbiplanobs import _fastcoord
+from vlbiplanobs.bands import BANDS, band_index
 
 """Module that defines the `Station` and `Stations` objects, which represent a station (antenna)
 or a network composed of antennas.
 """
 
-__all__ = ['Station', 'SelectedStation', 'Stations']
+__all__ = ['Station', 'SelectedStation', 'Stations', 'altaz_batch']
 
+# Time resolution used to interpolate the astrometric context in the coordinate transformations.
+# VLBI observability only requires ~arcsec precision, so interpolating the slowly varying parts
+# of the transformation on this grid speeds up the computations by orders of magnitude while
+# keeping errors well below the milli-arcsecond level.
+_astrom_resolution = 10*u.min
+
+
+def _astrom_context():
+    """Returns the context manager that makes the ICRS-to-AltAz transformations interpolate
+    the astrometric values with the currently set time resolution (see
+    `Stations.set_astrom_resolution`).
+
+    If an interpolator is already active, it returns a no-op context instead:
+    erfa_astrom is a class-global ScienceState, so entering/exiting it from several
+    threads at once (e.g. the workers of `Stations.altaz_all`) would restore the global
+    state out of order. The calling thread enters the context once and the workers
+    leave the state untouched.
+    """
+    if isinstance(erfa_astrom.get(), ErfaAstromInterpolator):
+        return contextlib.nullcontext()
+
+    return erfa_astrom.set(ErfaAstromInterpolator(_astrom_resolution))
+
+
+# Maximum number of (obs_times, target) altaz results memoized per station.
+_max_cached_altaz = 128
+
+_cache_uid = itertools.count()
+
+
+def _cache_id(obj) -> int:
+    """Returns the cache identifier stamped on the given object, assigning (and stamping)
+    a new one the first time the object is seen. Returns None for objects that do not
+    accept new attributes, in which case the caller must fall back to hashing the values.
+    """
+    cache_id = getattr(obj, '_vlbi_cache_id', None)
+    if cache_id is None:
+        cache_id = next(_cache_uid)
+        try:
+            obj._vlbi_cache_id = cache_id
+        except (AttributeError, TypeError):
+            return None
+
+    return cache_id
+
+
+def _altaz_cache_key(obs_times: Time, target) -> tuple:
+    """Returns a hashable key identifying the given (obs_times, target) combination,
+    used to memoize the results of the coordinate transformations.
+
+    Both objects are stamped with a unique identifier on first use, so repeated calls
+    with the same objects (the common scheduler pattern) build the key in O(1) instead
+    of hashing the full time array on every call. Each key component is tagged with its
+    source ('id' for stamped identifiers, 'h' for value hashes) so a value hash can
+    never collide with a stamped id.
+    """
+    time_key = _cache_id(obs_times)
+    if time_key is not None:
+        time_key = ('id', time_key)
+    else:
+        time_key = ('h', hash(np.asarray(obs_times.jd).tobytes()))
+
+    target_key = _cache_id(target)
+    if target_key is not None:
+        target_key = ('id', target_key)
+    else:
+        target_coord = target.coord if isinstance(target, FixedTarget) else target
+        target_key = ('h', hash((np.asarray(target_coord.ra.deg).tobytes(),
+                                 np.asarray(target_coord.dec.deg).tobytes())))
+
+    return (time_key, target_key)
+
+
+def targets_to_skycoord(targets) -> coord.SkyCoord:
+    """Converts the given target(s) into a single (non-scalar) SkyCoord object.
+
+    Inputs
+    - targets : astropy.coordinates.SkyCoord, astroplan.FixedTarget, or a list of them
+        The target source(s) to convert.
+
+    Output
+    - skycoord : astropy.coordinates.SkyCoord
+        A single SkyCoord object containing (all) the target coordinates.
+        It is guaranteed to be non-scalar, even if a single target was provided.
+    """
+    if isinstance(targets, FixedTarget):
+        skycoord = targets.coord
+    elif isinstance(targets, coord.SkyCoord):
+        skycoord = targets
+    else:
+        skycoord = coord.SkyCoord([t.coord if isinstance(t, FixedTarget) else t for t in targets])
+
+    if skycoord.isscalar:
+        skycoord = skycoord.reshape(1)
+
+    return skycoord
+
+
+def altaz_batch(stations, obs_times: Time, targets) -> coord.SkyCoord:
+    """Computes the altitude/azimuth of the given target(s) as seen from all the given stations
+    at all the given times, with a single coordinate transformation.
+
+    Instead of transforming the coordinates once per station and per target (as one would do by
+    calling Station.altaz in a loop), it stacks all station locations into a single (vector)
+    EarthLocation and all targets into a single SkyCoord, so the whole grid is computed in
+    one single call to the underlying (erfa) transformation.
+
+    Inputs
+    - stations : list of Station (or Stations)
+        The stations from where the target(s) will be observed.
+    - obs_times : astropy.time.Time
+        Time(s) to compute the coordinates of the source(s)
+        (either a single timestamp or an array of times).
+    - targets : astropy.coordinates.SkyCoord, astroplan.FixedTarget, or a list of them
+        Target(s) to observe.
+
+    Output
+    - altaz : astropy.coordinates.SkyCoord
+        The altitude/azimuth of the targets with shape (n_stations, n_times, n_targets).
+    """
+    skycoord = targets_to_skycoord(targets)
+    if obs_times.isscalar:
+        obs_times = obs_times.reshape(1)
+
+    if isinstance(stations, Stations):
+        xyz = stations.locations_xyz
+        locations = coord.EarthLocation.from_geocentric(xyz[:, 0]*u.m, xyz[:, 1]*u.m, xyz[:, 2]*u.m)
+    else:
+        stations = list(stations)
+        locations = coord.EarthLocation.from_geocentric(u.Quantity([s.location.x for s in stations]),
+                                                        u.Quantity([s.location.y for s in stations]),
+                                                        u.Quantity([s.location.z for s in stations]))
+    altaz_frame = coord.AltAz(obstime=obs_times[np.newaxis, :, np.newaxis],
+                              location=locations[:, np.newaxis, np.newaxis])
+    with _astrom_context():
+        return skycoord.transform_to(altaz_frame)
 
 
 class Station(object):
@@ -76,32 +220,45 @@ class Station(object):
         assert isinstance(fullname, str) or fullname is None
         assert isinstance(all_networks, str) or fullname is None
         assert type(real_time) is bool, "'real_time' must be a bool."
-        self.observer = Observer(name=name.replace('_', ' '), location=location)
+        self._name = name.replace('_', ' ')
+        self._location = location
+        self._observer = None
         self._codename = codename
         self._network = network
         self._freqs_sefds = freqs_sefds
-        assert isinstance(min_elevation, float) or isinstance(min_elevation, int) \
-               or isinstance(min_elevation, u.Quantity), \
-               "'min_elevation' must be either a float, int, or an astropy.units.Quantity object."
-        if isinstance(min_elevation, float) or isinstance(min_elevation, int):
-            self._min_elev = min_elevation*u.deg
-        else:  # isinstance(min_elevation, u.Quantity):
-            assert min_elevation.unit.is_equivalent(u.deg), \
-                   "'min_elevation' must have angular units (e.g. degrees)"
-            self._min_elev = min_elevation
-
-        self._fullname = name if fullname is None else fullname
-        self._all_networks = network if all_networks is None else all_networks
+        # Note that this coercion is a no-op when min_elevation is already a Quantity in degrees,
+        # and it also covers e.g. numpy scalar types. Non-angular units raise UnitConversionError.
+        self._min_elev = u.Quantity(min_elevation, u.deg)
+        self._min_elev_deg = float(self._min_elev.to_value(u.deg))
+        self._min_elev_rad = float(self._min_elev.to_value(u.rad))
+
+        self._fullname = fullname or name
+        self._all_networks = all_networks or network
         self._country = country
         self._diameter = diameter
         self._real_time = real_time
+        self._altaz_cache = {}
 
 
     @property
     def name(self) -> str:
         """Name of the station.
         """
-        return self.observer.name
+        return self._name
+
+
+    @property
+    def observer(self) -> Observer:
+        """Returns the station as an astroplan.Observer object.
+
+        The Observer is only built (once) when this property is accessed: all the
+        computations in this class go directly through the station location, which
+        avoids the expensive Observer construction per station.
+        """
+        if self._observer is None:
+            self._observer = Observer(name=self._name, location=self._location)
+
+        return self._observer
 
 
     @property
@@ -160,7 +317,7 @@ class Station(object):
     def location(self) -> coord.EarthLocation:
         """Location of the station as an astropy.coordinates.EarthLocation object.
         """
-        return self.observer.location
+        return self._location
 
 
     @property
@@ -202,7 +359,7 @@ class Station(object):
         - elevations : astropy.coordinates.angles.Latitute
             Elevation of the source at the given obs_times.
         """
-        return self.observer.altaz(obs_times, target).alt
+        return self.altaz(obs_times, target).alt
 
 
     def altaz(self, obs_times: Time, target: FixedTarget) -> coord.SkyCoord:
@@ -218,11 +375,27 @@ class Station(object):
         Output
         - altaz : astropy.coordinates.sky_coordinate.SkyCoord
             Altitude and azimuth of the source for each given time.
+            Note that the results are memoized, so passing the same (obs_times, target)
+            combination again will not trigger a new computation.
         """
-        return self.observer.altaz(obs_times, target)
+        cache_key = _altaz_cache_key(obs_times, target)
+        if cache_key in self._altaz_cache:
+            return self._altaz_cache[cache_key]
+
+        target_coord = target.coord if isinstance(target, FixedTarget) else target
+        altaz_frame = coord.AltAz(obstime=obs_times, location=self._location)
+        with _astrom_context():
+            altaz = target_coord.transform_to(altaz_frame)
+
+        if len(self._altaz_cache) >= _max_cached_altaz:
+            # Drops the oldest entry to keep the memory usage bounded.
+            del self._altaz_cache[next(iter(self._altaz_cache))]
+
+        self._altaz_cache[cache_key] = altaz
+        return altaz
 
 
-    def is_visible(self, obs_times: Time, target: FixedTarget) -> tuple:
+    def is_visible(self, obs_times: Time, target: FixedTarget) -> np.ndarray:
         """Returns when the target source is visible for this station at the given times.
 
         Inputs
@@ -233,15 +406,50 @@ class Station(object):
              Target coordinates to observe. If None, the target would be assumed to be visible at all times.
 
         Output
-        - visible : tuple
-            Tuple containing the indexes of obs_times when the target source is visible
-            from the station. Therefore obs_times[visible] would return only those times.
+        - visible : numpy.ndarray (bool)
+            Boolean array, with the same shape as obs_times, that is True at the times when
+            the target source is visible from the station (i.e. above its minimum elevation).
+            Therefore obs_times[visible] would return only those times, and masks from
+            different stations can be combined with plain element-wise logical operations.
         """
         if target is None:
-            return (np.arange(2),)
+            return np.ones(np.shape(obs_times.jd), dtype=bool)
+
+        return self._alt_deg(obs_times, target) >= self._min_elev_deg
+
+
+    def _alt_deg(self, obs_times: Time, target) -> np.ndarray:
+        """Returns the altitude of the target at the given times as a plain numpy array,
+        in degrees.
+
+        For (scalar) ICRS targets it skips the astropy frame machinery and calls the erfa
+        routines directly (see `vlbiplanobs._fastcoord`), which is several times faster.
+        It still reuses any altaz result already memoized for the same inputs.
+        """
+        cache_key = _altaz_cache_key(obs_times, target)
+        if cache_key in self._altaz_cache:
+            return self._altaz_cache[cache_key].alt.deg
+
+        target_coord = target.coord if isinstance(target, FixedTarget) else target
+        if isinstance(target_coord.frame, coord.ICRS) and target_coord.isscalar:
+            with _astrom_context():
+                return np.rad2deg(_fastcoord.icrs_to_alt(target_coord.ra.rad, target_coord.dec.rad,
+                                                         obs_times, self._location))
+
+        return self.altaz(obs_times, target).alt.deg
 
-        elevations = self.elevation(obs_times, target)
-        return np.where(elevations >= self.min_elevation)
+
+    def _altaz_deg(self, obs_times: Time, target) -> tuple:
+        """Returns the (altitude, azimuth) of the target at the given times as a tuple of
+        plain numpy arrays, in degrees.
+
+        Inner-loop code should use this (or `_alt_deg` when the azimuth is not needed)
+        rather than `altaz`/`elevation`: every operation on a Quantity allocates, while
+        these arrays can be compared and combined for free. Units are re-attached only
+        at the public API boundary.
+        """
+        altaz = self.altaz(obs_times, target)
+        return altaz.alt.to_value(u.deg), altaz.az.to_value(u.deg)
 
 
     def has_band(self, band: str) -> bool:
@@ -360,6 +568,48 @@ class SelectedStation(Station):
 
 
 
+@functools.lru_cache(maxsize=4)
+def _parse_stations_catalog(filename: str = None) -> dict:
+    """Parses the given stations catalog file (or the default one if None) and returns
+    a dictionary with the station codenames as keys and plain dictionaries with the raw
+    station parameters as values.
+
+    The results are memoized, so repeated calls with the same filename do not re-read
+    nor re-parse the file. The returned dictionaries are shared between calls and thus
+    must not be modified.
+    """
+    config = configparser.ConfigParser()
+    if filename is None:
+        with resources.path("data", "stations_catalog.inp") as stations_catalog_path:
+            config.read(stations_catalog_path)
+    else:
+        # With this approach it raises a FileNotFound exception.
+        # Otherwise config will run smoothly and provide an empty list.
+        config.read(open(filename, 'r'))
+
+    stations_catalog = {}
+    for stationname in config.sections():
+        xyz = np.fromstring(config[stationname]['position'], sep=',', dtype=np.float64)
+        sefds = {}
+        for akey in config[stationname].keys():
+            if 'SEFD_' in akey.upper():
+                sefds[f"{akey.upper().replace('SEFD_', '').strip()}cm"] = \
+                                    float(config[stationname][akey])
+
+        stations_catalog[config[stationname]['code']] = {
+                'name': stationname, 'code': config[stationname]['code'],
+                'network': config[stationname]['network'],
+                'possible_networks': config[stationname]['possible_networks'],
+                'country': config[stationname]['country'],
+                'diameter': config[stationname]['diameter'],
+                'position': (xyz[0], xyz[1], xyz[2]),
+                'min_elevation': float(config[stationname]['min_elevation']),
+                'real_time': config[stationname].getboolean('real_time', fallback=False),
+                'sefds': sefds, 'station': config[stationname]['station']}
+
+    return stations_catalog
+
+
 class Stations(object):
     """Defines a network (collection) of stations (`Station` objects) that
     can participate in an observation together.
@@ -376,16 +626,49 @@ class Stations(object):
         assert isinstance(name, str), "'name' must be a str."
         assert isinstance(stations, abc.Iterable), "'stations' must be a list."
         self._name = name
-        self._stations = {}
-        for a_station in stations:
-            assert isinstance(a_station, Station), \
-                f"There is an element in 'stations' that is not a Station object ({a_station})."
-            if a_station.codename not in self._stations.keys():
-                self._stations[a_station.codename] = a_station
-            else:
-                print(f"WARNING: {a_station.codename} is duplicated in the 'stations' list.")
+        stations = list(stations)
+        assert all(isinstance(a_station, Station) for a_station in stations), \
+            "There is an element in 'stations' that is not a Station object."
+        # A single C-level dict construction; a length mismatch can only mean duplicates.
+        self._stations = {a_station.codename: a_station for a_station in stations}
+        if len(self._stations) != len(stations):
+            raise ValueError(f"There are duplicated codenames in the 'stations' list "
+                             f"for the network {name}.")
 
         self._codenames = tuple(self._stations.keys())
+        self._pending = {}
+        self._xyz = None
+        self._min_elev_rad = None
+        self._sefd_table = None
+        self._stations_tuple = None
+
+
+    def _add_pending(self, codename: str, raw_station: dict):
+        """Registers a station that is not built yet: only its raw (parsed) parameters are
+        stored, and the SelectedStation object will be constructed on first access.
+        """
+        self._stations[codename] = None
+        self._pending[codename] = raw_station
+        self._codenames = tuple(self._stations.keys())
+        self._xyz = None
+        self._min_elev_rad = None
+        self._sefd_table = None
+        self._stations_tuple = None
+
+
+    def _build(self, codename: str) -> Station:
+        """Builds (and stores) the SelectedStation for the given pending codename.
+        """
+        raw = self._pending.pop(codename)
+        x, y, z = raw['position']
+        # Note the copy of the SEFD dict: the raw one lives in the lru_cache'd catalog and
+        # Station.sefds exposes it as a public (mutable) property.
+        a_station = SelectedStation(raw['name'], raw['code'], raw['network'],
+                coord.EarthLocation(x*u.m, y*u.m, z*u.m), dict(raw['sefds']),
+                raw['min_elevation']*u.deg, raw['station'], raw['possible_networks'],
+                raw['country'], raw['diameter'], raw['real_time'])
+        self._stations[codename] = a_station
+        return a_station
 
 
     @property
@@ -402,17 +685,23 @@ class Stations(object):
 
 
     @property
-    def stations(self) -> list:
-        """Returns a list containing all stations in the network.
+    def stations(self) -> tuple:
+        """Returns a tuple containing all stations in the network.
+        The tuple is cached (and invalidated when the network mutates), so repeated bulk
+        accesses do not allocate a new container; mutations must go through `add` et al.
         """
-        return list(self._stations.values())
+        if self._stations_tuple is None:
+            self._stations_tuple = tuple(s if s is not None else self._build(c)
+                                         for c, s in self._stations.items())
+
+        return self._stations_tuple
 
 
     @property
     def number_of_stations(self) -> int:
         """Returns the total number of stations in the network.
         """
-        return len(self.stations)
+        return len(self._stations)
 
 
     @property
@@ -422,15 +711,74 @@ class Stations(object):
         return tuple(self._codenames)
 
 
+    @property
+    def locations_xyz(self) -> np.ndarray:
+        """Returns the geocentric (x, y, z) coordinates of all stations in the network
+        as a contiguous (n_stations, 3) array, in meters.
+        The rows follow the same order as `codenames`.
+        """
+        if self._xyz is None:
+            self._xyz = np.empty((len(self._stations), 3), dtype=np.float64)
+            for i, (codename, a_station) in enumerate(self._stations.items()):
+                if a_station is None:
+                    self._xyz[i, :] = self._pending[codename]['position']
+                else:
+                    loc = a_station.location
+                    self._xyz[i, :] = (loc.x.to_value(u.m), loc.y.to_value(u.m), loc.z.to_value(u.m))
+
+        return self._xyz
+
+
+    @property
+    def min_elevations_rad(self) -> np.ndarray:
+        """Returns the minimum elevation of all stations in the network as a contiguous
+        (n_stations,) array, in radians.
+        The entries follow the same order as `codenames`.
+        """
+        if self._min_elev_rad is None:
+            self._min_elev_rad = np.array(
+                    [np.deg2rad(self._pending[c]['min_elevation']) if s is None
+                     else s._min_elev_rad
+                     for c, s in self._stations.items()], dtype=np.float64)
+
+        return self._min_elev_rad
+
+
+    @property
+    def sefd_table(self) -> np.ndarray:
+        """Returns the system equivalent flux densities (SEFDs) of all stations in the network
+        as a contiguous (n_stations, n_bands) array, in Jy.
+        The rows follow the same order as `codenames`, and the columns the canonical band
+        ordering from `vlbiplanobs.bands`. Bands that a station cannot observe hold `inf`.
+        """
+        if self._sefd_table is None:
+            all_sefds = [self._pending[c]['sefds'] if s is None else s.sefds
+                         for c, s in self._stations.items()]
+            # First registers all bands so the number of columns is final before filling.
+            for station_sefds in all_sefds:
+                for a_band in station_sefds:
+                    band_index(a_band)
+
+            self._sefd_table = np.full((len(self._stations), len(BANDS)), np.inf,
+                                       dtype=np.float64)
+            for i, station_sefds in enumerate(all_sefds):
+                for a_band, a_sefd in station_sefds.items():
+                    self._sefd_table[i, band_index(a_band)] = a_sefd
+
+        return self._sefd_table
+
+
     @property
     def observing_bands(self) -> set:
         """Returns a set with all `bands` that the stations in the network can observe,
         or at least a subset of stations.
         """
         bands = set()
-        for a_station in self._stations.values():
-                station_bands = set(a_station.bands)
-                bands.update(station_bands)
+        for codename, a_station in self._stations.items():
+            if a_station is None:
+                bands.update(self._pending[codename]['sefds'].keys())
+            else:
+                bands.update(set(a_station.bands))
 
         return bands
 
@@ -445,11 +793,170 @@ class Stations(object):
             Station to be added to the network.
         """
         assert isinstance(a_station, Station)
-        if a_station.codename in self.codenames:
-            print(f"WARNING: {a_station.codename} already in {self.name}. Ignoring addition.")
+        if a_station.codename in self._stations:
+            warnings.warn(f"{a_station.codename} already in {self.name}. Ignoring addition.")
         else:
             self._stations[a_station.codename] = a_station
             self._codenames = tuple(self._stations.keys())
+            self._xyz = None
+            self._min_elev_rad = None
+            self._sefd_table = None
+            self._stations_tuple = None
+
+
+    @staticmethod
+    def set_astrom_resolution(dt: u.Quantity):
+        """Sets the time resolution used to interpolate the astrometric context in all
+        the coordinate transformations (elevation, altitude/azimuth, visibility).
+
+        The slowly varying parts of the transformation are computed only every `dt` and
+        interpolated in between, so larger values make long simulations faster at the cost
+        of precision. The default (10 min) keeps the errors well below the milli-arcsecond
+        level, far more accurate than required to determine source visibility.
+
+        Inputs
+        - dt : astropy.units.Quantity
+            Time resolution for the astrometric interpolation (e.g. 10*u.min).
+        """
+        global _astrom_resolution
+        assert dt.unit.is_equivalent(u.s), "'dt' must have time units (e.g. minutes)."
+        _astrom_resolution = dt
+
+
+    def visibility(self, obs_times: Time, targets) -> np.ndarray:
+        """Returns when the given target(s) are visible from all the stations in the network
+        for the given times.
+        All the station/time/target combinations are computed with a single coordinate
+        transformation (see `altaz_batch`), which is significantly faster than calling
+        Station.is_visible per station.
+
+        Inputs
+        - obs_times : astropy.time.Time
+            Time(s) to compute the elevation of the source(s)
+            (either a single timestamp or an array of times).
+        - targets : astropy.coordinates.SkyCoord, astroplan.FixedTarget, or a list of them
+            Target(s) to observe.
+
+        Output
+        - visible : numpy.ndarray (bool)
+            Boolean array with shape (n_stations, n_times, n_targets) that is True whenever
+            the given target is above the minimum elevation of the given station.
+        """
+        altaz = altaz_batch(self, obs_times, targets)
+        alt_rad = altaz.alt.to_value(u.rad)
+        return alt_rad >= self.min_elevations_rad[:, np.newaxis, np.newaxis]
+
+
+    def altaz_all(self, obs_times: Time, target, max_workers: int = None) -> dict:
+        """Returns the altitude/azimuth of the target source as seen by each station in the
+        network for the given observing times.
+
+        The per-station transformations are independent and release the GIL inside the
+        underlying (erfa) C code, so for large workloads they are run in a thread pool.
+        For small inputs, where the thread overhead would dominate, it falls back to a
+        plain serial loop.
+
+        Inputs
+        - obs_times : astropy.time.Time
+            Time to compute the coordinates of the source
+            (either a single timestamp or an array of times).
+        - target : astropy.coordinates.SkyCoord or astroplan.FixedTarget
+            Target to observe.
+        - max_workers : int [OPTIONAL]
+            Maximum number of threads to use. If not given, it is left up to
+            concurrent.futures (typically the number of CPUs).
+
+        Output
+        - altaz : dict
+            Dictionary where the keys are the station code names, and the values the
+            altitude/azimuth of the source (as astropy.coordinates.SkyCoord) at each
+            observing time, as returned by Station.altaz.
+        """
+        all_stations = self.stations
+        # The astrom context is entered once here: erfa_astrom is a class-global state
+        # that must not be set/restored concurrently from the worker threads.
+        with _astrom_context():
+            if len(all_stations)*obs_times.size <= 1e4:
+                return {s.codename: s.altaz(obs_times, target) for s in all_stations}
+
+            with futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+                results = list(pool.map(lambda s: s.altaz(obs_times, target), all_stations))
+
+        return {s.codename: altaz for s, altaz in zip(all_stations, results)}
+
+
+    def elevation_grid(self, obs_times: Time, targets, dtype=np.float32) -> np.ndarray:
+        """Returns the elevation of the given target(s) as seen from all the stations in
+        the network at all the given times, as one contiguous array.
+
+        All the station/time/target combinations are computed with a single coordinate
+        transformation (see `altaz_batch`). By default the result is cast down to float32,
+        which halves the memory traffic of display-oriented consumers (visibility matrices,
+        u-v coverage heatmaps) while still preserving milli-arcsecond-level accuracy for
+        altitudes in [0, 90] degrees. Scheduling code that wants the full precision can
+        pass dtype=np.float64.
+
+        Inputs
+        - obs_times : astropy.time.Time
+            Time(s) to compute the elevation of the source(s)
+            (either a single timestamp or an array of times).
+        - targets : astropy.coordinates.SkyCoord, astroplan.FixedTarget, or a list of them
+            Target(s) to observe.
+        - dtype : numpy dtype [OPTIONAL]
+            Type of the returned array (np.float32 by default).
+
+        Output
+        - elevations : numpy.ndarray
+            Elevations in degrees, with shape (n_stations, n_times, n_targets).
+        """
+        alt_deg = altaz_batch(self, obs_times, targets).alt.to_value(u.deg)
+        return np.ascontiguousarray(alt_deg.astype(dtype, copy=False))
+
+
+    def rise_set_grid(self, times: Time, target, N: int = 150) -> dict:
+        """Returns the times at which the target source rises above, or sets below,
+        the minimum elevation of each station in the network.
+
+        The rise/set times are searched on a regular grid of N samples spanning the given
+        times: the elevations for all stations are computed with a single batched
+        transformation (see `altaz_batch`) and the exact crossing times are then obtained
+        by linearly interpolating the two samples bracketing each crossing of the minimum
+        elevation. N thus trades accuracy for speed: the crossing times are accurate to a
+        fraction of the grid step.
+
+        Inputs
+        - times : astropy.time.Time
+            Array of times (at least the start and end time) defining the period to search.
+        - target : astropy.coordinates.SkyCoord or astroplan.FixedTarget
+            Target to observe.
+        - N : int [OPTIONAL]
+            Number of samples in the search grid (150 by default).
+
+        Output
+        - rise_set : dict
+            Dictionary where the keys are the station code names, and the values are a
+            (rise_times, set_times) tuple of astropy.time.Time arrays with the times when
+            the source rises above, or sets below, the station minimum elevation.
+            Either array can be empty (e.g. for circumpolar or never-visible sources).
+        """
+        grid = times[0] + np.linspace(0, 1, N)*(times[-1] - times[0])
+        alt_rad = altaz_batch(self, grid, target).alt.to_value(u.rad)[:, :, 0]
+        delta = alt_rad - self.min_elevations_rad[:, np.newaxis]
+        delta0, delta1 = delta[:, :-1], delta[:, 1:]
+        # Linear interpolation of the time where each pair of samples crosses zero.
+        with np.errstate(divide='ignore', invalid='ignore'):
+            frac = np.where(delta1 != delta0, delta0/(delta0 - delta1), 0.0)
+
+        jd_grid = grid.jd
+        jd_cross = jd_grid[:-1] + frac*np.diff(jd_grid)
+        rising = (delta0 < 0) & (delta1 >= 0)
+        setting = (delta0 >= 0) & (delta1 < 0)
+        rise_set = {}
+        for i, codename in enumerate(self.codenames):
+            rise_set[codename] = (Time(jd_cross[i][rising[i]], format='jd', scale=grid.scale),
+                                  Time(jd_cross[i][setting[i]], format='jd', scale=grid.scale))
+
+        return rise_set
 
 
     def __str__(self):
@@ -462,27 +969,37 @@ class Stations(object):
 
     def __getitem__(self, key):
         if isinstance(key, int):
-            return self._stations[self.codenames[key]]
-        else:
-            return self._stations[key]
+            key = self._codenames[key]
+
+        a_station = self._stations[key]
+        return a_station if a_station is not None else self._build(key)
 
 
     def __setitem__(self, key, value):
         self._stations[key] = value
         self._codenames = tuple(self._stations.keys())
+        self._xyz = None
+        self._min_elev_rad = None
+        self._sefd_table = None
+        self._stations_tuple = None
 
 
     def __delitem__(self, key):
         if isinstance(key, int):
-            self._stations.__delitem__(self.keys[key])
-        else:
-            self._stations.__delitem__(key)
+            key = self._codenames[key]
+
+        self._stations.__delitem__(key)
+        self._pending.pop(key, None)
 
         self._codenames = tuple(self._stations.keys())
+        self._xyz = None
+        self._min_elev_rad = None
+        self._sefd_table = None
+        self._stations_tuple = None
 
 
     def __iter__(self):
-        return iter(self._stations.values())
+        return iter(self.stations)
 
 
     def __contains__(self, item):
@@ -529,34 +1046,10 @@ class Stations(object):
         - network : Stations
             Returns a Stations object containing the selected stations.
         """
-        config = configparser.ConfigParser()
-        if filename is None:
-            with resources.path("data", "stations_catalog.inp") as stations_catalog_path:
-                config.read(stations_catalog_path)
-        else:
-            # With this approach it raises a FileNotFound exception.
-            # Otherwise config will run smoothly and provide an empty list.
-            config.read(open(filename, 'r'))
-
         networks = Stations(name, [])
-        for stationname in config.sections():
-            if (codenames is None) or (config[stationname]['code'] in codenames):
-                temp = [float(i.strip()) for i in config[stationname]['position'].split(',')]
-                a_loc = coord.EarthLocation(temp[0]*u.m, temp[1]*u.m, temp[2]*u.m)
-                # Getting the SEFD values for the bands
-                min_elev = float(config[stationname]['min_elevation'])*u.deg
-                does_real_time = True if config[stationname]['real_time']=='yes' else False
-                sefds = {}
-                for akey in config[stationname].keys():
-                    if 'SEFD_' in akey.upper():
-                        sefds[f"{akey.upper().replace('SEFD_', '').strip()}cm"] = \
-                                            float(config[stationname][akey])
-
-                new_station = SelectedStation(stationname, config[stationname]['code'],
-                        config[stationname]['network'], a_loc, sefds, min_elev,
-                        config[stationname]['station'], config[stationname]['possible_networks'],
-                        config[stationname]['country'], config[stationname]['diameter'], does_real_time)
-                networks.add(new_station)
+        for codename, raw_station in _parse_stations_catalog(filename).items():
+            if (codenames is None) or (codename in codenames):
+                networks._add_pending(codename, raw_station)
 
         return networks
 
@@ -581,9 +1074,16 @@ class Stations(object):
             output_network_name = f"{self.name}@{band}"
 
         subnetwork = Stations(output_network_name, [])
-        for station in self.stations:
-            if band in station.bands:
-                subnetwork.add(station)
+        column = band_index(band)
+        if column < self.sefd_table.shape[1]:
+            # Builds the backing dict in a single pass: going through add() per station
+            # would rebuild the codename tuple once per entry.
+            matching = [self._codenames[row] for row in
+                        np.flatnonzero(np.isfinite(self.sefd_table[:, column]))]
+            subnetwork._stations = {c: self._stations[c] for c in matching}
+            subnetwork._pending = {c: self._pending[c] for c in matching
+                                   if self._stations[c] is None}
+            subnetwork._codenames = tuple(matching)
 
         return subnetwork
 
@@ -609,7 +1109,7 @@ class Stations(object):
         """
         subnetwork = Stations(name if name is not None else f"sub{self.name}", [])
         for codename in codenames:
-            subnetwork.add(self.stations[codename])
+            subnetwork.add(self[codename])
 
         return subnetwork
 